@@ -1,9 +1,12 @@
 """FastAPI application for Claude Code Plugin MCP."""
 
+from typing import NoReturn
+
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastmcp import FastMCP
 from fastmcp.server.openapi import MCPType, RouteMap
+from pydantic import TypeAdapter
 
 from cc_plugin_mcp.models import (
     LoadedElementsResponse,
@@ -25,6 +28,31 @@ app = FastAPI(
 # Initialize plugin service
 plugin_service = PluginService()
 
+# Response serializers, built once at import instead of per response
+_PLUGIN_INFO_LIST_ADAPTER = TypeAdapter(list[PluginInfo])
+_LOADED_ELEMENTS_ADAPTER = TypeAdapter(LoadedElementsResponse)
+
+
+def _raise_http_error(
+    exc: ValueError | FileNotFoundError,
+    not_found_detail: str,
+    bad_request_detail: str,
+) -> NoReturn:
+    """Map a plugin service error to an HTTP error.
+
+    Args:
+        exc: The error raised by the plugin service.
+        not_found_detail: Detail message for a 404 response.
+        bad_request_detail: Detail message for a 400 response.
+
+    Raises:
+        HTTPException: 404 for FileNotFoundError, 400 for ValueError.
+
+    """
+    if isinstance(exc, FileNotFoundError):
+        raise HTTPException(status_code=404, detail=not_found_detail) from exc
+    raise HTTPException(status_code=400, detail=bad_request_detail) from exc
+
 
 @app.get("/health")
 async def health_check() -> dict[str, str]:
@@ -32,8 +60,14 @@ async def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
-@app.get("/plugins", operation_id="list_plugins")
-async def get_plugins() -> list[PluginInfo]:
+# Plugin endpoints are sync so FastAPI runs their blocking file I/O in its
+# threadpool instead of on the event loop
+@app.get(
+    "/plugins",
+    operation_id="list_plugins",
+    response_model=list[PluginInfo],
+)
+def get_plugins() -> Response:
     """Get list of all available plugins from marketplaces.
 
     Returns:
@@ -41,7 +75,7 @@ async def get_plugins() -> list[PluginInfo]:
         (agents, commands, skills).
 
     Raises:
-        HTTPException: If plugins cannot be read.
+        HTTPException: If the plugin directory is not found.
 
     """
     try:
@@ -51,20 +85,22 @@ async def get_plugins() -> list[PluginInfo]:
             status_code=404,
             detail=f"Plugin directory not found: {e!s}",
         ) from e
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error reading plugins: {e!s}",
-        ) from e
     else:
-        return plugins
+        return Response(
+            content=_PLUGIN_INFO_LIST_ADAPTER.dump_json(plugins),
+            media_type="application/json",
+        )
 
 
-@app.post("/plugins/{plugin_name}/load-elements", operation_id="load_elements")
-async def load_plugin_elements_endpoint(
+@app.post(
+    "/plugins/{plugin_name}/load-elements",
+    operation_id="load_elements",
+    response_model=LoadedElementsResponse,
+)
+def load_plugin_elements_endpoint(
     plugin_name: str,
     request: PluginElementRequest,
-) -> LoadedElementsResponse:
+) -> Response:
     """Load plugin elements (skills, agents, commands) with their content.
 
     Args:
@@ -75,43 +111,29 @@ async def load_plugin_elements_endpoint(
         Response with loaded element contents.
 
     Raises:
-        HTTPException: If plugin is not found or elements cannot be read.
+        HTTPException: If plugin is not found or an element type is invalid.
 
     """
     try:
-        # Convert PluginElement objects to dicts
-        elements_data = [
-            {
-                "type": element.element_type,
-                "name": element.name,
-            }
-            for element in request.elements
-        ]
-
         loaded_elements = plugin_service.load_plugin_elements(
             plugin_name,
-            elements_data,
+            request.elements,
+        )
+    except (ValueError, FileNotFoundError) as e:
+        _raise_http_error(
+            e,
+            f"Plugin not found: {plugin_name}",
+            f"Invalid element type: {e!s}",
         )
-    except ValueError as e:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid element type: {e!s}",
-        ) from e
-    except FileNotFoundError as e:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Plugin not found: {plugin_name}",
-        ) from e
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error loading plugin elements: {e!s}",
-        ) from e
     else:
-        return LoadedElementsResponse(
+        response = LoadedElementsResponse.model_construct(
             plugin_name=plugin_name,
             elements=loaded_elements,
         )
+        return Response(
+            content=_LOADED_ELEMENTS_ADAPTER.dump_json(response),
+            media_type="application/json",
+        )
 
 
 @app.exception_handler(ValueError)
@@ -126,18 +148,6 @@ async def value_error_handler(
     )
 
 
-@app.exception_handler(Exception)
-async def general_exception_handler(
-    _request: Request,
-    exc: Exception,
-) -> JSONResponse:
-    """Handle general exceptions."""
-    return JSONResponse(
-        status_code=500,
-        content={"error": "Internal server error", "detail": str(exc)},
-    )
-
-
 # Configure route maps to exclude health check endpoint
 route_maps = [
     # Exclude health check endpoint - it's not an MCP tool
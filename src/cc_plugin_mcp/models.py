@@ -1,9 +1,16 @@
 """Pydantic models for plugin data."""
 
+import re
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+# Alphanumeric characters, hyphens, and underscores
+_NAME_RE = re.compile(r"[\w-]+")
+
+# Element types a plugin can provide
+VALID_ELEMENT_TYPES: frozenset[str] = frozenset({"skills", "agents", "commands"})
+
 
 class PluginInfo(BaseModel):
     """Basic plugin information."""
@@ -22,8 +29,7 @@ class PluginInfo(BaseModel):
             raise ValueError("Plugin name cannot be empty")
         if len(v) > 256:
             raise ValueError("Plugin name cannot exceed 256 characters")
-        # Allow alphanumeric, hyphens, underscores
-        if not all(c.isalnum() or c in "-_" for c in v):
+        if not _NAME_RE.fullmatch(v):
             raise ValueError(
                 "Plugin name can only contain alphanumeric characters, "
                 "hyphens, and underscores",
@@ -41,10 +47,10 @@ class PluginElement(BaseModel):
     @classmethod
     def validate_element_type(cls, v: str) -> str:
         """Validate element type."""
-        valid_types = {"skills", "agents", "commands"}
-        if v not in valid_types:
+        if v not in VALID_ELEMENT_TYPES:
             raise ValueError(
-                f"Invalid element type '{v}'. Must be one of {valid_types}",
+                f"Invalid element type '{v}'. "
+                f"Must be one of {sorted(VALID_ELEMENT_TYPES)}",
             )
         return v
 
@@ -1,15 +1,79 @@
 """Plugin service for reading and processing plugin data."""
 
-import json
 import logging
+import os
+import stat
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from cc_plugin_mcp.models import LoadedElement, PluginDetail, PluginInfo
+import orjson
+
+from cc_plugin_mcp.models import (
+    VALID_ELEMENT_TYPES,
+    LoadedElement,
+    PluginDetail,
+    PluginElement,
+    PluginInfo,
+)
 
 logger = logging.getLogger(__name__)
 
+# Plugin index entry: (marketplace_dir, marketplace_data, plugin_def)
+_IndexEntry = tuple[Path, dict[str, Any], dict[str, Any]]
+
+# Parsed marketplace entry: (mtime_ns, size, marketplace_data)
+_MarketplaceEntry = tuple[int, int, dict[str, Any]]
+
+# Shared pool for reading and parsing marketplace files concurrently
+_MARKETPLACE_POOL = ThreadPoolExecutor(
+    max_workers=8,
+    thread_name_prefix="marketplace-loader",
+)
+
+
+def _path_stem(path: str) -> str:
+    """Get the final path component without its suffix.
+
+    Uses string operations only. The result matches Path(path).stem for
+    ordinary file and directory names, but differs for edge cases such as a
+    trailing dot ("foo." gives "foo") or a final "." component ("dir/."
+    gives ".").
+
+    Args:
+        path: A file or directory path.
+
+    Returns:
+        The stem of the path.
+
+    """
+    return os.path.splitext(os.path.basename(path.rstrip("/")))[0]
+
+
+@lru_cache(maxsize=512)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> str:  # noqa: ARG001
+    """Read a text file, caching the content per (path, mtime_ns, size).
+
+    The modification time and size are part of the cache key only, so an
+    edited file is read again on the next lookup.
+
+    Args:
+        path: String path to the file.
+        mtime_ns: Modification time of the file in nanoseconds.
+        size: Size of the file in bytes.
+
+    Returns:
+        The file content.
+
+    Raises:
+        OSError: If the file cannot be read.
+
+    """
+    with Path(path).open() as f:
+        return f.read()
+
 
 class PluginService:
     """Service for managing plugin data."""
@@ -25,8 +89,146 @@ class PluginService:
             plugins_dir = Path.home() / ".claude" / "plugins"
         self.plugins_dir = plugins_dir
         self.marketplaces_dir = self.plugins_dir / "marketplaces"
-        # Initialize cache
-        self._marketplace_cache = {}
+        # Parsed marketplace.json cache: path -> (mtime_ns, size, data)
+        self._mp_cache: dict[Path, _MarketplaceEntry] = {}
+        # Plugin-name index and the marketplace file states it was built from
+        self._index: dict[str, _IndexEntry] | None = None
+        self._index_key: tuple[tuple[Path, int, int], ...] | None = None
+        # Resolved base directories for path validation
+        self._resolved_base_cache: dict[Path, Path] = {}
+
+    def clear_cache(self) -> None:
+        """Clear cached marketplace data, plugin index, and element content.
+
+        Caches are validated against file modification times on every lookup,
+        so this is only needed when files change without their mtime or size
+        changing, or when plugin directories are moved.
+        """
+        self._mp_cache.clear()
+        self._index = None
+        self._index_key = None
+        self._resolved_base_cache.clear()
+        _read_text_cached.cache_clear()
+
+    def _get_cached_marketplace(
+        self,
+        marketplace_path: Path,
+    ) -> _MarketplaceEntry | None:
+        """Get the cached entry for a marketplace.json file if it is unchanged.
+
+        Args:
+            marketplace_path: Path to the marketplace.json file.
+
+        Returns:
+            The cached (mtime_ns, size, marketplace_data) entry, or None if the
+            file is not cached, has changed, or cannot be stat'ed.
+
+        """
+        cached = self._mp_cache.get(marketplace_path)
+        if cached is None:
+            return None
+
+        try:
+            st = marketplace_path.stat()
+        except OSError:
+            return None
+
+        if cached[:2] != (st.st_mtime_ns, st.st_size):
+            return None
+
+        return cached
+
+    def _load_marketplace(self, marketplace_path: Path) -> _MarketplaceEntry:
+        """Read and parse a marketplace.json file, caching the result.
+
+        Args:
+            marketplace_path: Path to the marketplace.json file.
+
+        Returns:
+            (mtime_ns, size, marketplace_data) of the file that was parsed.
+
+        Raises:
+            OSError: If the file cannot be read.
+            orjson.JSONDecodeError: If the file has invalid JSON.
+
+        """
+        st = marketplace_path.stat()
+        marketplace_data = orjson.loads(marketplace_path.read_bytes())
+
+        entry = (st.st_mtime_ns, st.st_size, marketplace_data)
+        self._mp_cache[marketplace_path] = entry
+        return entry
+
+    def _load_marketplaces(
+        self,
+        marketplace_paths: list[Path],
+    ) -> list[_MarketplaceEntry | OSError | orjson.JSONDecodeError]:
+        """Load several marketplace.json files, parsing changed ones in parallel.
+
+        Unchanged files are served from the cache inline; only files that
+        need to be read again are handed to the thread pool.
+
+        Args:
+            marketplace_paths: Paths to the marketplace.json files.
+
+        Returns:
+            For each path, in order, the (mtime_ns, size, marketplace_data)
+            entry or the error raised while loading it.
+
+        """
+
+        def load(
+            marketplace_path: Path,
+        ) -> _MarketplaceEntry | OSError | orjson.JSONDecodeError:
+            try:
+                return self._load_marketplace(marketplace_path)
+            except (OSError, orjson.JSONDecodeError) as e:
+                return e
+
+        cached = [self._get_cached_marketplace(path) for path in marketplace_paths]
+        cold_paths = [
+            path
+            for path, entry in zip(marketplace_paths, cached, strict=True)
+            if entry is None
+        ]
+
+        # A single file is not worth the thread handoff
+        if len(cold_paths) <= 1:
+            loaded = iter([load(path) for path in cold_paths])
+        else:
+            loaded = _MARKETPLACE_POOL.map(load, cold_paths)
+
+        return [entry if entry is not None else next(loaded) for entry in cached]
+
+    def _iter_marketplace_files(self) -> Iterator[tuple[Path, Path]]:
+        """Iterate over marketplace directories that contain a marketplace.json.
+
+        Uses os.scandir so directory checks reuse the cached entry type
+        instead of issuing a stat call per entry.
+
+        Yields:
+            (marketplace_dir, marketplace_path) tuples.
+
+        """
+        try:
+            with os.scandir(self.marketplaces_dir) as it:
+                entries = list(it)
+        except (FileNotFoundError, NotADirectoryError):
+            return
+
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+
+            marketplace_path = os.path.join(
+                entry.path,
+                ".claude-plugin",
+                "marketplace.json",
+            )
+            if not os.path.isfile(marketplace_path):
+                continue
+
+            yield Path(entry.path), Path(marketplace_path)
 
     def _validate_safe_path(self, base_dir: Path, relative_path: str) -> Path:
         """Validate that a path is safe and within the base directory.
@@ -42,15 +244,53 @@ class PluginService:
             ValueError: If path is outside the base directory (path traversal attempt).
 
         """
-        base_dir_resolved = base_dir.resolve()
-        full_path = (base_dir / relative_path).resolve()
+        full_path = self._validate_safe_path_resolved(
+            self._resolve_base_dir(base_dir),
+            relative_path,
+        )
+        if full_path is None:
+            msg = f"Invalid path: {relative_path} attempts to access outside {base_dir}"
+            raise ValueError(msg)
+
+        return full_path
+
+    def _resolve_base_dir(self, base_dir: Path) -> Path:
+        """Resolve a base directory, caching the result.
+
+        Args:
+            base_dir: The base directory to resolve.
+
+        Returns:
+            The resolved base directory.
+
+        """
+        base_dir_resolved = self._resolved_base_cache.get(base_dir)
+        if base_dir_resolved is None:
+            base_dir_resolved = base_dir.resolve()
+            self._resolved_base_cache[base_dir] = base_dir_resolved
+        return base_dir_resolved
+
+    def _validate_safe_path_resolved(
+        self,
+        base_dir_resolved: Path,
+        relative_path: str,
+    ) -> Path | None:
+        """Resolve a relative path against an already resolved base directory.
+
+        Args:
+            base_dir_resolved: The resolved base directory to validate against.
+            relative_path: The relative path to validate.
+
+        Returns:
+            The resolved path, or None if it is outside the base directory.
+
+        """
+        # The joined path is always resolved so symlinks cannot escape the base
+        full_path = (base_dir_resolved / relative_path).resolve()
 
         # Check that the resolved path is within the base directory
-        try:
-            full_path.relative_to(base_dir_resolved)
-        except ValueError as e:
-            msg = f"Invalid path: {relative_path} attempts to access outside {base_dir}"
-            raise ValueError(msg) from e
+        if not full_path.is_relative_to(base_dir_resolved):
+            return None
 
         return full_path
 
@@ -62,7 +302,7 @@ class PluginService:
 
         Raises:
             FileNotFoundError: If required plugin files are not found.
-            json.JSONDecodeError: If plugin files have invalid JSON.
+            orjson.JSONDecodeError: If plugin files have invalid JSON.
 
         """
         return self._get_all_marketplace_plugins()
@@ -80,44 +320,43 @@ class PluginService:
 
         plugins: list[PluginInfo] = []
 
-        # Iterate through all marketplace directories
-        for marketplace_dir in self.marketplaces_dir.iterdir():
-            if not marketplace_dir.is_dir():
-                continue
+        # Load all marketplace files, then extract plugins in a single pass
+        marketplace_paths = [path for _, path in self._iter_marketplace_files()]
+        results = self._load_marketplaces(marketplace_paths)
 
-            marketplace_path = marketplace_dir / ".claude-plugin" / "marketplace.json"
-            if not marketplace_path.exists():
-                continue
-
-            try:
-                with marketplace_path.open() as f:
-                    marketplace_data = json.load(f)
-
-                # Extract plugins from marketplace.json
-                marketplace_plugins = marketplace_data.get("plugins", [])
-                for plugin in marketplace_plugins:
-                    # Extract elements from plugin definition
-                    agents = self._extract_element_names(plugin.get("agents", []))
-                    commands = self._extract_element_names(
-                        plugin.get("commands", []),
-                    )
-                    skills = self._extract_element_names(plugin.get("skills", []))
-
-                    plugin_info_obj = PluginInfo(
-                        name=plugin.get("name", ""),
-                        description=plugin.get("description", ""),
-                        agents=agents,
-                        commands=commands,
-                        skills=skills,
-                    )
-                    plugins.append(plugin_info_obj)
-            except (OSError, json.JSONDecodeError) as e:
+        for marketplace_path, result in zip(
+            marketplace_paths,
+            results,
+            strict=True,
+        ):
+            if isinstance(result, Exception):
                 # Skip invalid marketplace files
                 logger.warning(
-                    f"Skipping invalid marketplace file {marketplace_path}: {e!s}",
+                    f"Skipping invalid marketplace file {marketplace_path}: "
+                    f"{result!s}",
                 )
                 continue
 
+            _, _, marketplace_data = result
+
+            # Extract plugins from marketplace.json
+            marketplace_plugins = marketplace_data.get("plugins", [])
+            for plugin in marketplace_plugins:
+                # Extract elements from plugin definition
+                agents = self._extract_element_names(plugin.get("agents", []))
+                commands = self._extract_element_names(plugin.get("commands", []))
+                skills = self._extract_element_names(plugin.get("skills", []))
+
+                # Built from our own marketplace data, so skip validation
+                plugin_info_obj = PluginInfo.model_construct(
+                    name=plugin.get("name", ""),
+                    description=plugin.get("description", ""),
+                    agents=agents,
+                    commands=commands,
+                    skills=skills,
+                )
+                plugins.append(plugin_info_obj)
+
         return plugins
 
     def _extract_element_names(self, elements: list[Any]) -> list[str]:
@@ -134,9 +373,7 @@ class PluginService:
         for element in elements:
             if isinstance(element, str):
                 # Extract filename without extension from path
-                path = Path(element)
-                name = path.stem
-                names.append(name)
+                names.append(_path_stem(element))
             elif isinstance(element, dict):
                 # If it's a dict, try to get name field
                 if "name" in element:
@@ -154,45 +391,27 @@ class PluginService:
 
         Raises:
             FileNotFoundError: If plugin is not found in any marketplace.
-            json.JSONDecodeError: If plugin JSON is invalid.
+            orjson.JSONDecodeError: If plugin JSON is invalid.
 
         """
         if not self.marketplaces_dir.exists():
             msg = f"Marketplaces directory not found: {self.marketplaces_dir}"
             raise FileNotFoundError(msg)
 
-        # Search through all marketplace directories
-        for marketplace_dir in self.marketplaces_dir.iterdir():
-            if not marketplace_dir.is_dir():
-                continue
-
-            marketplace_path = marketplace_dir / ".claude-plugin" / "marketplace.json"
-            if not marketplace_path.exists():
-                continue
-
-            try:
-                with marketplace_path.open() as f:
-                    marketplace_data = json.load(f)
-
-                # Check if this plugin exists in this marketplace
-                marketplace_plugins = marketplace_data.get("plugins", [])
-                for plugin in marketplace_plugins:
-                    if plugin.get("name") == plugin_name:
-                        # Found the plugin, return only this plugin's data
-                        return PluginDetail(
-                            name=plugin.get("name", ""),
-                            owner=marketplace_data.get("owner"),
-                            metadata=plugin.get("metadata")
-                            or marketplace_data.get("metadata"),
-                            plugins=[plugin],
-                        )
-            except (OSError, json.JSONDecodeError):
-                # Skip invalid marketplace files
-                continue
+        entry = self._get_index().get(plugin_name)
+        if entry is None:
+            # Plugin not found in any marketplace
+            msg = f"Plugin '{plugin_name}' not found in any marketplace"
+            raise FileNotFoundError(msg)
 
-        # Plugin not found in any marketplace
-        msg = f"Plugin '{plugin_name}' not found in any marketplace"
-        raise FileNotFoundError(msg)
+        # Return only this plugin's data, copied so callers cannot change the index
+        _, marketplace_data, plugin = entry
+        return PluginDetail.model_construct(
+            name=plugin.get("name", ""),
+            owner=marketplace_data.get("owner"),
+            metadata=plugin.get("metadata") or marketplace_data.get("metadata"),
+            plugins=[dict(plugin)],
+        )
 
     def find_plugin_in_marketplace(
         self,
@@ -204,61 +423,77 @@ class PluginService:
             plugin_name: Name of the plugin to find.
 
         Returns:
-            Plugin definition dict or None if not found.
+            A shallow copy of the plugin definition dict, or None if not found.
 
         """
-        try:
-            plugin_detail = self.describe_plugin(plugin_name)
-            plugins = plugin_detail.plugins
-
-            for plugin in plugins:
-                if plugin.get("name") == plugin_name:
-                    return plugin
-
-            return None
-        except FileNotFoundError:
+        entry = self._get_index().get(plugin_name)
+        if entry is None:
             return None
 
-    @staticmethod
-    @lru_cache(maxsize=128)
-    def _find_plugin_marketplace_dir_cached(
-        marketplaces_dir: str,
-        plugin_name: str,
-    ) -> str | None:
-        """Cached version of find_plugin_marketplace_dir.
+        # Copy so callers cannot change the cached index entry
+        return dict(entry[2])
 
-        Args:
-            marketplaces_dir: String representation of marketplaces directory.
-            plugin_name: Name of the plugin to find.
+    def _get_index(self) -> dict[str, _IndexEntry]:
+        """Get the plugin-name index, rebuilding it if any marketplace changed.
 
         Returns:
-            String path to the plugin's marketplace directory, or None if not found.
+            Dict mapping plugin names to index entries.
 
         """
-        marketplaces_path = Path(marketplaces_dir)
-        if not marketplaces_path.exists():
-            return None
-
-        for marketplace_dir in marketplaces_path.iterdir():
-            if not marketplace_dir.is_dir():
+        marketplaces: list[tuple[Path, dict[str, Any]]] = []
+        index_key: list[tuple[Path, int, int]] = []
+
+        marketplace_files = list(self._iter_marketplace_files())
+        results = self._load_marketplaces([path for _, path in marketplace_files])
+
+        for (marketplace_dir, marketplace_path), result in zip(
+            marketplace_files,
+            results,
+            strict=True,
+        ):
+            if isinstance(result, Exception):
                 continue
 
-            marketplace_path = marketplace_dir / ".claude-plugin" / "marketplace.json"
-            if not marketplace_path.exists():
-                continue
+            mtime_ns, size, marketplace_data = result
+            marketplaces.append((marketplace_dir, marketplace_data))
+            index_key.append((marketplace_path, mtime_ns, size))
 
-            try:
-                with marketplace_path.open() as f:
-                    marketplace_data = json.load(f)
-
-                marketplace_plugins = marketplace_data.get("plugins", [])
-                for plugin in marketplace_plugins:
-                    if plugin.get("name") == plugin_name:
-                        return str(marketplace_dir)
-            except (OSError, json.JSONDecodeError):
-                continue
+        if self._index is None or tuple(index_key) != self._index_key:
+            self._index = self._build_index(marketplaces)
+            self._index_key = tuple(index_key)
 
-        return None
+        return self._index
+
+    def _build_index(
+        self,
+        marketplaces: list[tuple[Path, dict[str, Any]]],
+    ) -> dict[str, _IndexEntry]:
+        """Build the plugin-name index from parsed marketplaces.
+
+        Args:
+            marketplaces: List of (marketplace_dir, marketplace_data) tuples.
+
+        Returns:
+            Dict mapping plugin names to index entries.
+            If several marketplaces define the same plugin, the first one wins.
+
+        """
+        index: dict[str, _IndexEntry] = {}
+        for marketplace_dir, marketplace_data in marketplaces:
+            for plugin in marketplace_data.get("plugins", []):
+                if not isinstance(plugin, dict):
+                    continue
+
+                # Skip entries whose name cannot be a lookup key
+                plugin_name = plugin.get("name")
+                if isinstance(plugin_name, str) and plugin_name:
+                    index.setdefault(
+                        plugin_name,
+                        (marketplace_dir, marketplace_data, plugin),
+                    )
+
+        logger.debug(f"Built plugin index with {len(index)} plugins")
+        return index
 
     def find_plugin_marketplace_dir(self, plugin_name: str) -> Path | None:
         """Find the marketplace directory for a specific plugin.
@@ -270,140 +505,158 @@ class PluginService:
             Path to the plugin's marketplace directory, or None if not found.
 
         """
-        # Use cached method for lookups
-        result_str = self._find_plugin_marketplace_dir_cached(
-            str(self.marketplaces_dir),
-            plugin_name,
-        )
-
-        if result_str is None:
+        entry = self._get_index().get(plugin_name)
+        if entry is None:
             logger.debug(f"Plugin '{plugin_name}' marketplace directory not found")
             return None
 
-        logger.debug(
-            f"Found plugin '{plugin_name}' marketplace directory (cached)",
-        )
-        return Path(result_str)
+        return entry[0]
 
     def _resolve_element_path(
         self,
-        marketplace_dir: Path,
-        plugin_source: str,
+        plugin_base_dir: Path,
         element_type: str,
         element_path: str,
-        element_name: str,
-    ) -> Path | None:
+    ) -> tuple[Path, os.stat_result] | None:
         """Resolve the full path to an element file.
 
         Args:
-            marketplace_dir: The marketplace directory.
-            plugin_source: The source directory of the plugin (relative path).
+            plugin_base_dir: The resolved source directory of the plugin.
             element_type: Type of element ('skills', 'agents', 'commands').
             element_path: The path from plugin definition.
-            element_name: The name of the element.
 
         Returns:
-            Full path to the element file, or None if not found.
+            (full_path, stat_result) of the element file, or None if not found.
 
         """
-        path_obj = Path(element_path)
-        name = path_obj.stem
-
-        if element_name not in (name, element_path):
-            return None
-
         # Resolve path relative to plugin source directory with security validation
-        try:
-            plugin_base_dir = marketplace_dir / plugin_source
-            full_path = self._validate_safe_path(plugin_base_dir, element_path)
-        except ValueError:
+        full_path = self._validate_safe_path_resolved(plugin_base_dir, element_path)
+        if full_path is None:
             # Path is outside the plugin directory
             return None
 
-        if element_type == "skills":
+        # Stat once and inspect the mode instead of exists/is_file/is_dir calls
+        st = self._stat(full_path)
+        if st is None:
+            return None
+
+        if element_type == "skills" and stat.S_ISDIR(st.st_mode):
             # For skills, the path might be a directory containing SKILL.md
-            if full_path.is_dir():
-                skill_file = full_path / "SKILL.md"
-                if skill_file.exists() and skill_file.is_file():
-                    return skill_file
-            elif full_path.exists() and full_path.is_file():
-                # If it's already a file, use it
-                return full_path
-
-        # For agents and commands, use the provided path directly
-        elif full_path.exists() and full_path.is_file():
-            return full_path
+            skill_file = full_path / "SKILL.md"
+            skill_st = self._stat(skill_file)
+            if skill_st is not None and stat.S_ISREG(skill_st.st_mode):
+                return skill_file, skill_st
+            return None
+
+        # Otherwise use the provided path directly if it is a file
+        if stat.S_ISREG(st.st_mode):
+            return full_path, st
 
         return None
 
-    def load_plugin_element(
-        self,
-        plugin_name: str,
-        element_type: str,
-        element_name: str,
-    ) -> LoadedElement | None:
-        """Load content of a plugin element (skill, command, or agent).
+    def _stat(self, path: Path) -> os.stat_result | None:
+        """Stat a path, returning None instead of raising.
 
         Args:
-            plugin_name: Name of the plugin.
-            element_type: Type of element ('skills', 'agents', 'commands').
-            element_name: Name of the element to load.
+            path: The path to stat.
 
         Returns:
-            LoadedElement object with content, or None if not found.
+            The stat result of the path, or None if it cannot be stat'ed.
+
+        """
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    def _index_element_paths(self, element_paths: Any) -> dict[str, list[str]]:
+        """Map element names to the element paths they refer to.
+
+        An element can be requested by its file stem or by its literal path.
+
+        Args:
+            element_paths: Element paths from the plugin definition. Anything
+                other than a list (e.g. a missing or null entry) has no paths.
+
+        Returns:
+            Dict mapping element names to candidate paths, in definition order.
+
+        """
+        paths_by_name: dict[str, list[str]] = {}
+        if not isinstance(element_paths, list):
+            return paths_by_name
+
+        for element_path in element_paths:
+            if not isinstance(element_path, str):
+                continue
+
+            name = _path_stem(element_path)
+            paths_by_name.setdefault(name, []).append(element_path)
+            if element_path != name:
+                paths_by_name.setdefault(element_path, []).append(element_path)
+
+        return paths_by_name
+
+    def _validate_element_type(self, element_type: str) -> None:
+        """Validate an element type.
+
+        Args:
+            element_type: Type of element to validate.
 
         Raises:
             ValueError: If element_type is invalid.
 
         """
-        valid_types = {"skills", "agents", "commands"}
-        if element_type not in valid_types:
-            msg = f"Invalid element_type '{element_type}'. Must be one of {valid_types}"
+        if element_type not in VALID_ELEMENT_TYPES:
+            msg = (
+                f"Invalid element_type '{element_type}'. "
+                f"Must be one of {sorted(VALID_ELEMENT_TYPES)}"
+            )
             logger.error(msg)
             raise ValueError(msg)
 
-        # Find the plugin's marketplace directory
-        marketplace_dir = self.find_plugin_marketplace_dir(plugin_name)
-        if not marketplace_dir:
-            return None
-
-        # Get plugin definition
-        plugin_def = self.find_plugin_in_marketplace(plugin_name)
-        if not plugin_def:
-            return None
+    def _resolve_and_read(
+        self,
+        plugin_name: str,
+        plugin_base_dir: Path,
+        element_type: str,
+        element_paths: list[str],
+        element_name: str,
+    ) -> LoadedElement | None:
+        """Resolve an element among its candidate paths and read it.
 
-        # Get the plugin source directory
-        plugin_source = plugin_def.get("source", "")
-        if not plugin_source:
-            return None
+        Args:
+            plugin_name: Name of the plugin (used for logging).
+            plugin_base_dir: The resolved source directory of the plugin.
+            element_type: Type of element ('skills', 'agents', 'commands').
+            element_paths: Candidate paths for element_name, in definition order.
+            element_name: Name of the element to load.
 
-        # Get the element paths from the plugin definition
-        element_paths = plugin_def.get(element_type, [])
-        if not element_paths:
-            return None
+        Returns:
+            LoadedElement object with content, or None if not found.
 
-        # Find the specific element
+        """
         for element_path in element_paths:
-            if not isinstance(element_path, str):
-                continue
-
-            full_path = self._resolve_element_path(
-                marketplace_dir,
-                plugin_source,
+            resolved = self._resolve_element_path(
+                plugin_base_dir,
                 element_type,
                 element_path,
-                element_name,
             )
 
-            if full_path:
+            if resolved:
+                # Reuse the stat from resolution as the content cache key
+                full_path, st = resolved
                 try:
-                    with full_path.open() as f:
-                        content = f.read()
+                    content = _read_text_cached(
+                        str(full_path),
+                        st.st_mtime_ns,
+                        st.st_size,
+                    )
                     logger.info(
                         f"Loaded {element_type} element '{element_name}' "
                         f"from plugin '{plugin_name}'",
                     )
-                    return LoadedElement(
+                    return LoadedElement.model_construct(
                         element_type=element_type,
                         name=element_name,
                         path=str(full_path),
@@ -421,33 +674,106 @@ class PluginService:
         )
         return None
 
+    def load_plugin_element(
+        self,
+        plugin_name: str,
+        element_type: str,
+        element_name: str,
+    ) -> LoadedElement | None:
+        """Load content of a plugin element (skill, command, or agent).
+
+        Args:
+            plugin_name: Name of the plugin.
+            element_type: Type of element ('skills', 'agents', 'commands').
+            element_name: Name of the element to load.
+
+        Returns:
+            LoadedElement object with content, or None if not found.
+
+        Raises:
+            ValueError: If element_type is invalid.
+
+        """
+        self._validate_element_type(element_type)
+
+        # Find the plugin's marketplace directory and definition
+        entry = self._get_index().get(plugin_name)
+        if entry is None:
+            return None
+        marketplace_dir, _, plugin_def = entry
+
+        # Get the plugin source directory
+        plugin_source = plugin_def.get("source", "")
+        if not plugin_source:
+            return None
+
+        # Get the element paths from the plugin definition
+        element_paths = plugin_def.get(element_type, [])
+        if not element_paths:
+            return None
+
+        paths_by_name = self._index_element_paths(element_paths)
+        return self._resolve_and_read(
+            plugin_name,
+            self._resolve_base_dir(marketplace_dir / plugin_source),
+            element_type,
+            paths_by_name.get(element_name, []),
+            element_name,
+        )
+
     def load_plugin_elements(
         self,
         plugin_name: str,
-        elements: list[dict[str, Any]],
+        elements: list[PluginElement],
     ) -> list[LoadedElement]:
         """Load multiple plugin elements.
 
+        The plugin is looked up once and every requested element is resolved
+        against the same plugin definition.
+
         Args:
             plugin_name: Name of the plugin.
-            elements: List of dicts with 'type' and 'name' keys.
-                     Example: [{"type": "skills", "name": "skill1"}, ...]
+            elements: List of elements to load.
 
         Returns:
             List of loaded elements.
 
+        Raises:
+            ValueError: If an element_type is invalid.
+
         """
+        entry = self._get_index().get(plugin_name)
+        marketplace_dir, _, plugin_def = entry if entry is not None else (None, {}, {})
+        plugin_source = plugin_def.get("source", "")
+
+        # Resolve the plugin source directory once for the whole batch
+        plugin_base_dir = None
+        if marketplace_dir is not None and plugin_source:
+            plugin_base_dir = self._resolve_base_dir(marketplace_dir / plugin_source)
+
+        # Element paths are indexed lazily, for the requested types only
+        paths_by_type: dict[str, dict[str, list[str]]] = {}
+
         loaded = []
         for element in elements:
-            element_type = element.get("type") or element.get("element_type")
-            element_name = element.get("name")
+            element_type = element.element_type
+            element_name = element.name
+
+            self._validate_element_type(element_type)
 
-            if not element_type or not element_name:
+            if plugin_base_dir is None:
                 continue
 
-            loaded_element = self.load_plugin_element(
+            paths_by_name = paths_by_type.get(element_type)
+            if paths_by_name is None:
+                paths_by_name = self._index_element_paths(plugin_def.get(element_type))
+                paths_by_type[element_type] = paths_by_name
+
+            loaded_element = self._resolve_and_read(
                 plugin_name,
+                plugin_base_dir,
                 element_type,
+                paths_by_name.get(element_name, []),
                 element_name,
             )
             if loaded_element:
@@ -1,143 +1,392 @@
 """Tests for FastAPI endpoints."""
 
-import json
+import logging
+import os
+import shutil
+import uuid
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
 from cc_plugin_mcp.main import app
-from cc_plugin_mcp.models import LoadedElement, PluginInfo
+from cc_plugin_mcp.models import LoadedElement, PluginElement, PluginInfo
 from cc_plugin_mcp.services.plugin_service import PluginService
 
+# marketplace.json payloads, serialized once at import time
+_MARKETPLACE_CANNED = orjson.dumps(
+    {
+        "name": "test-marketplace",
+        "owner": {"name": "Test Author"},
+        "metadata": {"version": "1.0.0", "description": "Test"},
+        "plugins": [
+            {
+                "name": "test-plugin",
+                "description": "Test plugin",
+                "source": "./plugins/test-plugin",
+                "skills": ["./SKILL.md"],
+            },
+            {
+                "name": "another-plugin",
+                "description": "Another plugin",
+                "source": "./plugins/another-plugin",
+            },
+        ],
+    }
+)
+# Single plugin named by %-formatting; str.format would clash with JSON braces
+_MARKETPLACE_NAMED_TEMPLATE = orjson.dumps(
+    {"plugins": [{"name": "%s", "description": ""}]}
+)
+_MARKETPLACE_TRAVERSAL = orjson.dumps(
+    {
+        "plugins": [
+            {
+                "name": "test-plugin",
+                "source": "./plugins/test-plugin",
+                "agents": ["../../secret.md"],
+            }
+        ]
+    }
+)
+_MARKETPLACE_SKILL_DIRS = orjson.dumps(
+    {
+        "plugins": [
+            {
+                "name": "test-plugin",
+                "source": "./plugins/test-plugin",
+                "skills": ["./my-skill", "./missing-skill"],
+            }
+        ]
+    }
+)
+_MARKETPLACE_PLUGIN1 = orjson.dumps(
+    {"plugins": [{"name": "plugin1", "source": "./p1"}]}
+)
+_MARKETPLACE_PLUGIN1_2 = orjson.dumps(
+    {
+        "plugins": [
+            {"name": "plugin1", "source": "./p1"},
+            {"name": "plugin2", "source": "./p2"},
+        ]
+    }
+)
+
+# Relative locations within a plugins root
+_MARKETPLACE_DIR = "marketplaces/test-marketplace"
+_MARKETPLACE_FILE = f"{_MARKETPLACE_DIR}/.claude-plugin/marketplace.json"
+_PLUGIN_SOURCE_DIR = f"{_MARKETPLACE_DIR}/plugins/test-plugin"
+
+
+def _build_tree(root: Path, files: dict[str, str | bytes]) -> None:
+    """Write files under root, creating each parent directory once.
+
+    Args:
+        root: Directory the relative paths are resolved against
+        files: Mapping of relative file path to text or raw bytes content
+
+    """
+    for directory in {os.path.dirname(rel_path) for rel_path in files}:
+        os.makedirs(root / directory, exist_ok=True)
+    for rel_path, content in files.items():
+        if isinstance(content, bytes):
+            (root / rel_path).write_bytes(content)
+        else:
+            (root / rel_path).write_text(content)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link src to dst, falling back to a copy where links are unsupported.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client():
+    """Provide an in-process ASGI client shared across the test session."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def temp_plugin_dir(fs):
+    """Create a unique plugin directory in pyfakefs's in-memory filesystem.
+
+    The uuid subdirectory keeps paths distinct between tests, so
+    module-level caches keyed on file paths never see a previous test's
+    files.
+    """
+    path = Path("/plugins") / uuid.uuid4().hex
+    fs.create_dir(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def golden_tree(tmp_path_factory):
+    """Build the canonical plugins root once per session.
+
+    Tests must treat the tree as read-only and use ``fresh_tree`` when they
+    need to modify it.
+    """
+    plugins_root = tmp_path_factory.mktemp("golden")
+    _build_tree(
+        plugins_root,
+        {
+            _MARKETPLACE_FILE: _MARKETPLACE_CANNED,
+            f"{_PLUGIN_SOURCE_DIR}/SKILL.md": "# Test Skill Content",
+        },
+    )
+    return plugins_root
+
+
+@pytest.fixture(scope="session")
+def canned_marketplace(golden_tree):
+    """Provide the golden tree's marketplace directory."""
+    return golden_tree / _MARKETPLACE_DIR
+
+
+@pytest.fixture
+def fresh_tree(golden_tree, tmp_path):
+    """Provide a per-test copy of the golden tree.
+
+    Files are hard links into the golden tree, so tests must replace a file
+    (write a new one and ``os.replace`` it) rather than write it in place.
+    """
+    copy_root = tmp_path / "copy"
+    shutil.copytree(golden_tree, copy_root, copy_function=_link_or_copy)
+    return copy_root
+
 
 @pytest.fixture
-def client():
-    """Provide FastAPI test client."""
-    return TestClient(app)
+def service(temp_plugin_dir):
+    """Provide a PluginService rooted at the per-test plugin directory."""
+    return PluginService(plugins_dir=temp_plugin_dir)
+
+
+@pytest.fixture(scope="module")
+def canned_service(canned_marketplace):
+    """Provide a PluginService over the canned tree, shared by read-only tests."""
+    return PluginService(plugins_dir=canned_marketplace.parent.parent)
 
 
 @pytest.fixture
-def temp_plugin_dir():
-    """Create temporary plugin directory for testing."""
-    with TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def empty_service(monkeypatch):
+    """Provide a PluginService that discovers no marketplaces.
+
+    Marketplace discovery and the marketplaces directory existence check are
+    stubbed out, so lookups never touch the filesystem and need no fake
+    filesystem either.
+    """
+    service = PluginService(plugins_dir=Path("/nonexistent-plugins"))
+    marketplaces_dir = MagicMock(spec=Path)
+    marketplaces_dir.exists.return_value = True
+    monkeypatch.setattr(service, "marketplaces_dir", marketplaces_dir)
+    monkeypatch.setattr(service, "_iter_marketplace_files", lambda: iter(()))
+    return service
+
+
+@pytest.fixture(scope="module")
+def warm_service(canned_marketplace):
+    """Provide a PluginService whose plugin index is already built."""
+    service = PluginService(plugins_dir=canned_marketplace.parent.parent)
+    service.find_plugin_marketplace_dir("test-plugin")
+    return service
+
+
+@pytest.fixture
+def in_memory_marketplaces(service, monkeypatch):
+    """Serve marketplace.json payloads to ``service`` from memory.
+
+    Returns a function taking a mapping of marketplace name to raw
+    marketplace.json bytes. Discovery and file reads are patched out, so
+    only JSON parsing and plugin extraction run.
+    """
+
+    def install(payloads: dict[str, bytes]) -> None:
+        service.marketplaces_dir.mkdir()
+        by_path = {}
+        for name, payload in payloads.items():
+            marketplace_dir = service.marketplaces_dir / name
+            by_path[marketplace_dir / ".claude-plugin" / "marketplace.json"] = payload
+        monkeypatch.setattr(
+            service,
+            "_iter_marketplace_files",
+            lambda: ((path.parent.parent, path) for path in by_path),
+        )
+        monkeypatch.setattr(
+            service,
+            "_load_marketplace",
+            lambda path: (0, len(by_path[path]), orjson.loads(by_path[path])),
+        )
+
+    return install
 
 
+@pytest.fixture
+def marketplace_with_elements(request, temp_plugin_dir):
+    """Build a test-plugin marketplace with the element files in request.param.
+
+    ``request.param`` maps an element type to its file names; each file is
+    written with ``"# <file name>"`` as its content.
+    """
+    plugin = {
+        "name": "test-plugin",
+        "description": "Test plugin",
+        "source": "./plugins/test-plugin",
+    }
+    files = {}
+    for element_type, file_names in request.param.items():
+        plugin[element_type] = [f"./{file_name}" for file_name in file_names]
+        for file_name in file_names:
+            files[f"{_PLUGIN_SOURCE_DIR}/{file_name}"] = f"# {file_name}"
+    files[_MARKETPLACE_FILE] = orjson.dumps({"plugins": [plugin]})
+    _build_tree(temp_plugin_dir, files)
+    return temp_plugin_dir
+
+
+@pytest.mark.asyncio(loop_scope="session")
 class TestHealthCheck:
     """Health check endpoint tests."""
 
-    def test_health_check_endpoint(self, client):
+    async def test_health_check_endpoint(self, async_client):
         """Test health check endpoint."""
-        response = client.get("/health")
+        response = await async_client.get("/health")
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
 
 
+@pytest.mark.asyncio(loop_scope="session")
+@patch.object(PluginService, "get_plugin_list", autospec=True)
 class TestGetPlugins:
     """Plugin list endpoint tests."""
 
-    def test_get_plugins(self, client):
+    async def test_get_plugins(self, mock_get_plugins, async_client):
         """Test getting all marketplace plugins."""
-        with patch.object(
-            PluginService, "get_plugin_list"
-        ) as mock_get_plugins:
-            mock_plugins = [
-                PluginInfo(
-                    name="test-plugin",
-                    description="Test plugin description",
-                ),
-                PluginInfo(
-                    name="another-plugin",
-                    description="Another plugin description",
-                ),
-            ]
-            mock_get_plugins.return_value = mock_plugins
+        mock_get_plugins.return_value = [
+            PluginInfo(
+                name="test-plugin",
+                description="Test plugin description",
+            ),
+            PluginInfo(
+                name="another-plugin",
+                description="Another plugin description",
+            ),
+        ]
 
-            response = client.get("/plugins")
-            assert response.status_code == 200
-            data = response.json()
-            assert len(data) == 2
-            assert data[0]["name"] == "test-plugin"
-            assert data[1]["name"] == "another-plugin"
+        response = await async_client.get("/plugins")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 2
+        assert data[0]["name"] == "test-plugin"
+        assert data[1]["name"] == "another-plugin"
 
-    def test_get_plugins_file_not_found(self, client):
+    async def test_get_plugins_file_not_found(self, mock_get_plugins, async_client):
         """Test error handling when plugin file not found."""
-        with patch.object(
-            PluginService, "get_plugin_list"
-        ) as mock_get_plugins:
-            mock_get_plugins.side_effect = FileNotFoundError(
-                "Plugin directory not found"
-            )
+        mock_get_plugins.side_effect = FileNotFoundError("Plugin directory not found")
+
+        response = await async_client.get("/plugins")
+        assert response.status_code == 404
+
+    async def test_get_plugins_response_fields(self, mock_get_plugins, async_client):
+        """Test that service-built plugins are serialized with all fields."""
+        mock_get_plugins.return_value = [
+            PluginInfo.model_construct(
+                name="plugin.with.dots",
+                description="Built by the service",
+                agents=[],
+                commands=[],
+                skills=["skill1"],
+            ),
+        ]
 
-            response = client.get("/plugins")
-            assert response.status_code == 404
+        response = await async_client.get("/plugins")
+        assert response.status_code == 200
+        assert response.json() == [
+            {
+                "name": "plugin.with.dots",
+                "description": "Built by the service",
+                "agents": [],
+                "commands": [],
+                "skills": ["skill1"],
+            }
+        ]
+
+    async def test_get_plugins_unexpected_error(self, mock_get_plugins):
+        """Test that unexpected errors are left to FastAPI's default 500."""
+        mock_get_plugins.side_effect = RuntimeError("boom")
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app, raise_app_exceptions=False),
+            base_url="http://test",
+        ) as client:
+            response = await client.get("/plugins")
+        assert response.status_code == 500
 
 
 class TestPluginService:
     """Plugin service tests."""
 
-    def test_get_all_marketplace_plugins(self, temp_plugin_dir):
+    def test_get_all_marketplace_plugins(self, canned_service):
         """Test reading all plugins from marketplaces."""
-        # Create mock marketplace structure
-        marketplace_dir = temp_plugin_dir / "marketplaces" / "test-marketplace"
-        marketplace_dir.mkdir(parents=True)
-        plugin_dir = marketplace_dir / ".claude-plugin"
-        plugin_dir.mkdir(parents=True)
-
-        # Create marketplace.json
-        marketplace_file = plugin_dir / "marketplace.json"
-        marketplace_file.write_text(
-            json.dumps(
-                {
-                    "name": "test-marketplace",
-                    "plugins": [
-                        {
-                            "name": "plugin1",
-                            "description": "First plugin",
-                        },
-                        {
-                            "name": "plugin2",
-                            "description": "Second plugin",
-                        },
-                    ],
-                }
+        plugins = canned_service.get_plugin_list()
+
+        assert len(plugins) == 2
+        assert plugins[0].name == "test-plugin"
+        assert plugins[0].skills == ["SKILL"]
+        assert plugins[1].name == "another-plugin"
+
+    def test_get_plugins_from_multiple_marketplaces(
+        self, service, in_memory_marketplaces
+    ):
+        """Test reading plugins from several marketplaces, skipping invalid ones."""
+        payloads = {
+            f"marketplace{index}": (
+                _MARKETPLACE_NAMED_TEMPLATE % f"plugin{index}".encode()
             )
-        )
+            for index in range(3)
+        }
+        payloads["invalid-marketplace"] = b"{ invalid json }"
+        in_memory_marketplaces(payloads)
 
-        service = PluginService(plugins_dir=temp_plugin_dir)
         plugins = service.get_plugin_list()
 
-        assert len(plugins) == 2
-        assert plugins[0].name == "plugin1"
-        assert plugins[1].name == "plugin2"
+        assert sorted(p.name for p in plugins) == ["plugin0", "plugin1", "plugin2"]
 
-    def test_describe_plugin(self, temp_plugin_dir):
-        """Test getting plugin details."""
-        # Create marketplace structure
-        marketplace_dir = temp_plugin_dir / "marketplaces" / "test-marketplace"
-        plugin_dir = marketplace_dir / ".claude-plugin"
-        plugin_dir.mkdir(parents=True)
-
-        marketplace_file = plugin_dir / "marketplace.json"
-        plugin_data = {
-            "name": "test-marketplace",
-            "owner": {"name": "Test Author"},
-            "metadata": {"version": "1.0.0", "description": "Test"},
-            "plugins": [
-                {
-                    "name": "test-plugin",
-                    "description": "Test plugin",
-                    "source": "./plugins/test-plugin",
-                }
-            ],
+    def test_get_plugins_from_multiple_marketplace_files(
+        self, temp_plugin_dir, service
+    ):
+        """Test discovering and reading several marketplace files on disk."""
+        files = {
+            f"marketplaces/marketplace{index}/.claude-plugin/marketplace.json": (
+                _MARKETPLACE_NAMED_TEMPLATE % f"plugin{index}".encode()
+            )
+            for index in range(3)
         }
-        marketplace_file.write_text(json.dumps(plugin_data))
+        files["marketplaces/invalid-marketplace/.claude-plugin/marketplace.json"] = (
+            b"{ invalid json }"
+        )
+        _build_tree(temp_plugin_dir, files)
 
-        service = PluginService(plugins_dir=temp_plugin_dir)
-        plugin_detail = service.describe_plugin("test-plugin")
+        plugins = service.get_plugin_list()
+
+        assert sorted(p.name for p in plugins) == ["plugin0", "plugin1", "plugin2"]
+
+    def test_describe_plugin(self, canned_service):
+        """Test getting plugin details."""
+        plugin_detail = canned_service.describe_plugin("test-plugin")
 
         # Should return the requested plugin's data, not the marketplace data
         assert plugin_detail.name == "test-plugin"
@@ -145,14 +394,27 @@ class TestPluginService:
         assert len(plugin_detail.plugins) == 1
         assert plugin_detail.plugins[0]["name"] == "test-plugin"
 
+    def test_returned_plugin_definitions_do_not_alias_cache(
+        self, temp_plugin_dir, service
+    ):
+        """Test that changing a returned plugin definition leaves the cache intact."""
+        _build_tree(temp_plugin_dir, {_MARKETPLACE_FILE: _MARKETPLACE_PLUGIN1})
+
+        service.find_plugin_in_marketplace("plugin1")["source"] = "./changed"
+        service.describe_plugin("plugin1").plugins[0]["source"] = "./changed"
+
+        assert service.find_plugin_in_marketplace("plugin1") == {
+            "name": "plugin1",
+            "source": "./p1",
+        }
+        assert service.describe_plugin("plugin1").plugins[0]["source"] == "./p1"
+
 
 class TestPathTraversalSecurity:
     """Path traversal security tests."""
 
-    def test_path_traversal_attack_blocked(self, temp_plugin_dir):
+    def test_path_traversal_attack_blocked(self, temp_plugin_dir, service):
         """Test that path traversal attacks are blocked."""
-        service = PluginService(plugins_dir=temp_plugin_dir)
-
         # Create a mock marketplace structure
         marketplace_dir = temp_plugin_dir / "marketplaces" / "test-marketplace"
         marketplace_dir.mkdir(parents=True)
@@ -161,33 +423,42 @@ class TestPathTraversalSecurity:
         with pytest.raises(ValueError, match="Invalid path"):
             service._validate_safe_path(marketplace_dir, "../../../etc/passwd")
 
-    def test_valid_path_accepted(self, temp_plugin_dir):
-        """Test that valid paths within plugin directory are accepted."""
-        service = PluginService(plugins_dir=temp_plugin_dir)
+        # A symlink inside the directory must not lead outside it either
+        os.symlink("/etc/passwd", marketplace_dir / "evil")
+        with pytest.raises(ValueError, match="Invalid path"):
+            service._validate_safe_path(marketplace_dir, "evil")
+
+    def test_element_path_traversal_not_loaded(self, temp_plugin_dir, service):
+        """Test that element paths escaping the plugin source are not loaded."""
+        _build_tree(
+            temp_plugin_dir,
+            {
+                _MARKETPLACE_FILE: _MARKETPLACE_TRAVERSAL,
+                # A file outside the plugin source directory
+                f"{_MARKETPLACE_DIR}/secret.md": "secret",
+            },
+        )
 
-        # Create a mock marketplace structure
-        marketplace_dir = temp_plugin_dir / "marketplaces" / "test-marketplace"
-        marketplace_dir.mkdir(parents=True)
+        element = service.load_plugin_element("test-plugin", "agents", "secret")
+        assert element is None
 
+    def test_valid_path_accepted(self, temp_plugin_dir, service):
+        """Test that valid paths within plugin directory are accepted."""
         # Create a valid file
-        valid_file = marketplace_dir / "plugin.json"
-        valid_file.write_text("{}")
+        _build_tree(temp_plugin_dir, {f"{_MARKETPLACE_DIR}/plugin.json": "{}"})
+        marketplace_dir = temp_plugin_dir / _MARKETPLACE_DIR
 
         # Should not raise an exception
         result = service._validate_safe_path(marketplace_dir, "plugin.json")
         assert result.name == "plugin.json"
 
-    def test_nested_valid_path_accepted(self, temp_plugin_dir):
+    def test_nested_valid_path_accepted(self, temp_plugin_dir, service):
         """Test that valid nested paths within plugin directory are accepted."""
-        service = PluginService(plugins_dir=temp_plugin_dir)
-
-        marketplace_dir = temp_plugin_dir / "marketplaces" / "test-marketplace"
-        nested_dir = marketplace_dir / "plugins" / "test-plugin"
-        nested_dir.mkdir(parents=True)
-
         # Create a valid nested file
-        valid_file = nested_dir / "SKILL.md"
-        valid_file.write_text("# Test Skill")
+        _build_tree(
+            temp_plugin_dir, {f"{_PLUGIN_SOURCE_DIR}/SKILL.md": "# Test Skill"}
+        )
+        marketplace_dir = temp_plugin_dir / _MARKETPLACE_DIR
 
         # Should not raise an exception
         result = service._validate_safe_path(
@@ -200,21 +471,10 @@ class TestPathTraversalSecurity:
 class TestLogging:
     """Logging functionality tests."""
 
-    def test_invalid_marketplace_logged(self, temp_plugin_dir, caplog):
+    def test_invalid_marketplace_logged(self, service, in_memory_marketplaces, caplog):
         """Test that invalid marketplace files are logged as warnings."""
-        import logging
-
-        # Create a mock marketplace structure with invalid JSON
-        marketplace_dir = temp_plugin_dir / "marketplaces" / "test-marketplace"
-        marketplace_dir.mkdir(parents=True)
-        plugin_dir = marketplace_dir / ".claude-plugin"
-        plugin_dir.mkdir(parents=True)
-
-        # Create invalid JSON file
-        marketplace_file = plugin_dir / "marketplace.json"
-        marketplace_file.write_text("{ invalid json }")
-
-        service = PluginService(plugins_dir=temp_plugin_dir)
+        # Serve a marketplace with invalid JSON
+        in_memory_marketplaces({"test-marketplace": b"{ invalid json }"})
 
         with caplog.at_level(logging.WARNING):
             plugins = service.get_plugin_list()
@@ -222,91 +482,57 @@ class TestLogging:
         # Should return empty list
         assert len(plugins) == 0
         # Should have logged a warning
-        assert any("invalid" in record.message.lower() for record in caplog.records)
+        assert "invalid" in " ".join(caplog.messages).lower()
 
-    def test_plugin_elements_loading_logged(self, temp_plugin_dir, caplog):
+    def test_plugin_elements_loading_logged(self, canned_service, caplog):
         """Test that plugin elements loading is logged appropriately."""
-        import logging
-
-        # Create marketplace structure
-        marketplace_dir = temp_plugin_dir / "marketplaces" / "test-marketplace"
-        plugin_dir = marketplace_dir / ".claude-plugin"
-        plugin_dir.mkdir(parents=True)
-
-        plugin_source_dir = marketplace_dir / "plugins" / "test-plugin"
-        plugin_source_dir.mkdir(parents=True)
-
-        # Create marketplace.json and plugin files
-        marketplace_file = plugin_dir / "marketplace.json"
-        marketplace_file.write_text(
-            json.dumps(
-                {
-                    "plugins": [
-                        {
-                            "name": "test-plugin",
-                            "description": "Test plugin",
-                            "source": "./plugins/test-plugin",
-                            "skills": ["./SKILL.md"],
-                        }
-                    ]
-                }
-            )
-        )
-
-        # Create a skill file
-        skill_file = plugin_source_dir / "SKILL.md"
-        skill_file.write_text("# Test Skill")
-
-        service = PluginService(plugins_dir=temp_plugin_dir)
-
         with caplog.at_level(logging.INFO):
-            element = service.load_plugin_element("test-plugin", "skills", "SKILL")
+            element = canned_service.load_plugin_element(
+                "test-plugin", "skills", "SKILL"
+            )
 
         # Should have loaded the element
         assert element is not None
         # Should have logged load info
-        assert any(
-            "load" in record.message.lower() for record in caplog.records
-        ) or element is not None
+        assert caplog.records
+        assert "load" in " ".join(caplog.messages).lower()
 
 
 class TestErrorHandling:
     """Error handling consistency tests."""
 
-    def test_missing_marketplaces_dir_returns_empty_list(self, temp_plugin_dir):
+    def test_missing_marketplaces_dir_returns_empty_list(self, service):
         """Test that missing marketplaces directory returns empty list."""
         # Do not create marketplaces directory
-        service = PluginService(plugins_dir=temp_plugin_dir)
-
         plugins = service.get_plugin_list()
         assert plugins == []
 
-    def test_describe_plugin_not_found_raises_error(self, temp_plugin_dir):
+    def test_describe_plugin_not_found_raises_error(self, empty_service):
         """Test that describe_plugin raises FileNotFoundError when plugin not found."""
-        service = PluginService(plugins_dir=temp_plugin_dir)
+        with pytest.raises(FileNotFoundError, match="not found in any marketplace"):
+            empty_service.describe_plugin("nonexistent-plugin")
 
-        with pytest.raises(FileNotFoundError, match="not found"):
-            service.describe_plugin("nonexistent-plugin")
+    def test_describe_plugin_missing_marketplaces_dir(self, service):
+        """Test that describe_plugin reports a missing marketplaces directory."""
+        with pytest.raises(FileNotFoundError, match="Marketplaces directory"):
+            service.describe_plugin("test-plugin")
 
-    def test_find_plugin_in_marketplace_returns_none(self, temp_plugin_dir):
+    def test_find_plugin_in_marketplace_returns_none(self, empty_service):
         """Test that find_plugin_in_marketplace returns None when not found."""
-        service = PluginService(plugins_dir=temp_plugin_dir)
-
-        result = service.find_plugin_in_marketplace("nonexistent-plugin")
+        result = empty_service.find_plugin_in_marketplace("nonexistent-plugin")
         assert result is None
 
-    def test_find_plugin_marketplace_dir_returns_none(self, temp_plugin_dir):
+    def test_find_plugin_marketplace_dir_returns_none(self, empty_service):
         """Test that find_plugin_marketplace_dir returns None when not found."""
-        service = PluginService(plugins_dir=temp_plugin_dir)
-
-        result = service.find_plugin_marketplace_dir("nonexistent-plugin")
+        result = empty_service.find_plugin_marketplace_dir("nonexistent-plugin")
         assert result is None
 
 
 class TestLoadPluginElements:
     """Tests for load_plugin_elements endpoint and methods."""
 
-    def test_load_plugin_elements_endpoint(self, client):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_load_plugin_elements_endpoint(self, async_client):
         """Test POST /plugins/{plugin_name}/load-elements endpoint."""
         with patch.object(
             PluginService, "load_plugin_elements"
@@ -320,7 +546,7 @@ class TestLoadPluginElements:
                 )
             ]
 
-            response = client.post(
+            response = await async_client.post(
                 "/plugins/test-plugin/load-elements",
                 json={
                     "elements": [
@@ -335,243 +561,338 @@ class TestLoadPluginElements:
             assert len(data["elements"]) == 1
             assert data["elements"][0]["name"] == "SKILL"
 
-    def test_load_plugin_elements_invalid_type(self, client):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_load_plugin_elements_invalid_type(self, async_client):
         """Test that invalid element type returns 400."""
-        response = client.post(
+        response = await async_client.post(
             "/plugins/test-plugin/load-elements",
             json={"elements": [{"element_type": "invalid", "name": "test"}]},
         )
 
         assert response.status_code == 422
 
-    def test_load_plugin_elements_not_found(self, client):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_load_plugin_elements_not_found(self, async_client):
         """Test that plugin not found returns 404."""
         with patch.object(
             PluginService, "load_plugin_elements"
         ) as mock_load:
             mock_load.side_effect = FileNotFoundError("Plugin not found")
 
-            response = client.post(
+            response = await async_client.post(
                 "/plugins/nonexistent/load-elements",
                 json={"elements": [{"element_type": "skills", "name": "test"}]},
             )
 
             assert response.status_code == 404
 
-    def test_load_plugin_element_single(self, temp_plugin_dir):
-        """Test loading a single plugin element."""
-        # Setup marketplace structure
-        marketplace_dir = temp_plugin_dir / "marketplaces" / "test-marketplace"
-        plugin_dir = marketplace_dir / ".claude-plugin"
-        plugin_dir.mkdir(parents=True)
-
-        plugin_source_dir = marketplace_dir / "plugins" / "test-plugin"
-        plugin_source_dir.mkdir(parents=True)
-
-        # Create marketplace.json
-        marketplace_file = plugin_dir / "marketplace.json"
-        marketplace_file.write_text(
-            json.dumps(
-                {
-                    "plugins": [
-                        {
-                            "name": "test-plugin",
-                            "description": "Test plugin",
-                            "source": "./plugins/test-plugin",
-                            "skills": ["./SKILL.md"],
-                        }
-                    ]
-                }
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_load_plugin_elements_service_value_error(self, async_client):
+        """Test that a ValueError from the service returns 400."""
+        with patch.object(
+            PluginService, "load_plugin_elements"
+        ) as mock_load:
+            mock_load.side_effect = ValueError("bad element")
+
+            response = await async_client.post(
+                "/plugins/test-plugin/load-elements",
+                json={"elements": [{"element_type": "skills", "name": "test"}]},
             )
-        )
 
-        # Create skill file
-        skill_file = plugin_source_dir / "SKILL.md"
-        skill_file.write_text("# Test Skill Content")
+            assert response.status_code == 400
+            assert "bad element" in response.json()["detail"]
 
-        service = PluginService(plugins_dir=temp_plugin_dir)
+    @pytest.mark.parametrize(
+        "marketplace_with_elements", [{"skills": ["SKILL.md"]}], indirect=True
+    )
+    def test_load_plugin_element_single(self, marketplace_with_elements, service):
+        """Test loading a single plugin element."""
         element = service.load_plugin_element("test-plugin", "skills", "SKILL")
 
         assert element is not None
         assert element.name == "SKILL"
         assert element.element_type == "skills"
-        assert "Test Skill Content" in element.content
+        assert element.content == "# SKILL.md"
 
-    def test_load_multiple_elements(self, temp_plugin_dir):
-        """Test loading multiple plugin elements."""
-        # Setup marketplace structure
-        marketplace_dir = temp_plugin_dir / "marketplaces" / "test-marketplace"
-        plugin_dir = marketplace_dir / ".claude-plugin"
-        plugin_dir.mkdir(parents=True)
-
-        plugin_source_dir = marketplace_dir / "plugins" / "test-plugin"
-        plugin_source_dir.mkdir(parents=True)
-
-        # Create marketplace.json
-        marketplace_file = plugin_dir / "marketplace.json"
-        marketplace_file.write_text(
-            json.dumps(
-                {
-                    "plugins": [
-                        {
-                            "name": "test-plugin",
-                            "description": "Test plugin",
-                            "source": "./plugins/test-plugin",
-                            "skills": ["./SKILL1.md", "./SKILL2.md"],
-                            "agents": ["./agent.md"],
-                        }
-                    ]
-                }
-            )
+        # Elements can also be requested by their literal path
+        element_by_path = service.load_plugin_element(
+            "test-plugin", "skills", "./SKILL.md"
         )
+        assert element_by_path is not None
+        assert element_by_path.path == element.path
+
+    def test_load_skill_directory(self, temp_plugin_dir, service):
+        """Test loading a skill defined as a directory containing SKILL.md."""
+        _build_tree(
+            temp_plugin_dir,
+            {
+                _MARKETPLACE_FILE: _MARKETPLACE_SKILL_DIRS,
+                f"{_PLUGIN_SOURCE_DIR}/my-skill/SKILL.md": "# My Skill",
+            },
+        )
+        skill_dir = temp_plugin_dir / _PLUGIN_SOURCE_DIR / "my-skill"
 
-        # Create element files
-        (plugin_source_dir / "SKILL1.md").write_text("# Skill 1")
-        (plugin_source_dir / "SKILL2.md").write_text("# Skill 2")
-        (plugin_source_dir / "agent.md").write_text("# Agent")
+        element = service.load_plugin_element("test-plugin", "skills", "my-skill")
 
-        service = PluginService(plugins_dir=temp_plugin_dir)
+        assert element is not None
+        assert element.path == str((skill_dir / "SKILL.md").resolve())
+        assert element.content == "# My Skill"
+        assert (
+            service.load_plugin_element("test-plugin", "skills", "missing-skill")
+            is None
+        )
 
+    @pytest.mark.parametrize(
+        "marketplace_with_elements",
+        [{"skills": ["SKILL1.md", "SKILL2.md"], "agents": ["agent.md"]}],
+        indirect=True,
+    )
+    def test_load_multiple_elements(self, marketplace_with_elements, service):
+        """Test loading multiple plugin elements."""
         elements_to_load = [
-            {"type": "skills", "name": "SKILL1"},
-            {"type": "skills", "name": "SKILL2"},
-            {"type": "agents", "name": "agent"},
+            PluginElement(element_type="skills", name="SKILL1"),
+            PluginElement(element_type="skills", name="SKILL2"),
+            PluginElement(element_type="agents", name="agent"),
         ]
 
-        loaded = service.load_plugin_elements("test-plugin", elements_to_load)
+        with patch.object(
+            service, "_get_index", wraps=service._get_index
+        ) as mock_get_index:
+            loaded = service.load_plugin_elements("test-plugin", elements_to_load)
 
+        # The plugin is looked up once for the whole batch
+        assert mock_get_index.call_count == 1
         assert len(loaded) == 3
         assert any(e.name == "SKILL1" for e in loaded)
         assert any(e.name == "SKILL2" for e in loaded)
         assert any(e.name == "agent" for e in loaded)
 
+    def test_load_elements_with_null_element_lists(self, temp_plugin_dir, service):
+        """Test that null or non-list element entries are treated as empty."""
+        plugin = {
+            "name": "test-plugin",
+            "source": "./plugins/test-plugin",
+            "skills": ["./SKILL.md"],
+            "agents": None,
+            "commands": "./command.md",
+        }
+        _build_tree(
+            temp_plugin_dir,
+            {
+                _MARKETPLACE_FILE: orjson.dumps({"plugins": [plugin]}),
+                f"{_PLUGIN_SOURCE_DIR}/SKILL.md": "# Skill",
+            },
+        )
 
-class TestCaching:
-    """Tests for caching functionality."""
+        loaded = service.load_plugin_elements(
+            "test-plugin",
+            [
+                PluginElement(element_type="skills", name="SKILL"),
+                PluginElement(element_type="commands", name="command"),
+            ],
+        )
 
-    def test_find_plugin_marketplace_dir_caching(self, temp_plugin_dir):
-        """Test that find_plugin_marketplace_dir results are cached."""
-        # Setup marketplace structure
-        marketplace_dir = temp_plugin_dir / "marketplaces" / "test-marketplace"
-        plugin_dir = marketplace_dir / ".claude-plugin"
-        plugin_dir.mkdir(parents=True)
-
-        marketplace_file = plugin_dir / "marketplace.json"
-        marketplace_file.write_text(
-            json.dumps(
-                {
-                    "plugins": [
-                        {
-                            "name": "test-plugin",
-                            "description": "Test plugin",
-                            "source": "./plugins/test-plugin",
-                        }
-                    ]
-                }
-            )
+        assert [e.name for e in loaded] == ["SKILL"]
+        assert service.load_plugin_element("test-plugin", "agents", "agent") is None
+
+    def test_load_element_next_to_malformed_entries(self, temp_plugin_dir, service):
+        """Test that malformed sibling entries do not break plugin lookups."""
+        plugins = [
+            {"name": ["weird"], "source": "./plugins/weird"},
+            {"name": {"nested": "name"}},
+            "not-a-plugin",
+            {
+                "name": "test-plugin",
+                "source": "./plugins/test-plugin",
+                "skills": ["./SKILL.md"],
+            },
+        ]
+        _build_tree(
+            temp_plugin_dir,
+            {
+                _MARKETPLACE_FILE: orjson.dumps({"plugins": plugins}),
+                f"{_PLUGIN_SOURCE_DIR}/SKILL.md": "# Skill",
+            },
         )
 
-        service = PluginService(plugins_dir=temp_plugin_dir)
+        element = service.load_plugin_element("test-plugin", "skills", "SKILL")
 
-        # First call
-        result1 = service.find_plugin_marketplace_dir("test-plugin")
+        assert element is not None
+        assert element.content == "# Skill"
+        assert service.describe_plugin("test-plugin").name == "test-plugin"
 
-        # Second call - should be cached
-        result2 = service.find_plugin_marketplace_dir("test-plugin")
+
+class TestCaching:
+    """Tests for caching functionality."""
+
+    def test_find_plugin_marketplace_dir_caching(self, warm_service):
+        """Test that find_plugin_marketplace_dir results are cached."""
+        with patch.object(
+            warm_service, "_build_index", wraps=warm_service._build_index
+        ) as mock_build_index:
+            result1 = warm_service.find_plugin_marketplace_dir("test-plugin")
+            result2 = warm_service.find_plugin_marketplace_dir("test-plugin")
 
         assert result1 == result2
         assert result1 is not None
+        # Both lookups are served from the index built by the fixture
+        mock_build_index.assert_not_called()
 
-    def test_cache_invalidation_on_different_plugins(self, temp_plugin_dir):
+    def test_cache_invalidation_on_different_plugins(self, warm_service):
         """Test that cache works independently for different plugins."""
-        marketplace_dir = temp_plugin_dir / "marketplaces" / "test-marketplace"
-        plugin_dir = marketplace_dir / ".claude-plugin"
-        plugin_dir.mkdir(parents=True)
-
-        marketplace_file = plugin_dir / "marketplace.json"
-        marketplace_file.write_text(
-            json.dumps(
-                {
-                    "plugins": [
-                        {
-                            "name": "plugin1",
-                            "description": "Plugin 1",
-                            "source": "./plugins/plugin1",
-                        },
-                        {
-                            "name": "plugin2",
-                            "description": "Plugin 2",
-                            "source": "./plugins/plugin2",
-                        },
-                    ]
-                }
-            )
-        )
-
-        service = PluginService(plugins_dir=temp_plugin_dir)
-
-        result1 = service.find_plugin_marketplace_dir("plugin1")
-        result2 = service.find_plugin_marketplace_dir("plugin2")
+        with patch.object(
+            warm_service, "_build_index", wraps=warm_service._build_index
+        ) as mock_build_index:
+            result1 = warm_service.find_plugin_marketplace_dir("test-plugin")
+            result2 = warm_service.find_plugin_marketplace_dir("another-plugin")
 
         assert result1 == result2  # Same marketplace
         assert result1 is not None
+        mock_build_index.assert_not_called()
 
+    def test_plugin_index_refreshed_on_marketplace_change(
+        self, temp_plugin_dir, service
+    ):
+        """Test that plugin lookups see plugins added after the first lookup."""
+        _build_tree(temp_plugin_dir, {_MARKETPLACE_FILE: _MARKETPLACE_PLUGIN1})
+        marketplace_dir = temp_plugin_dir / _MARKETPLACE_DIR
+        marketplace_file = temp_plugin_dir / _MARKETPLACE_FILE
 
-class TestInputValidation:
-    """Tests for input validation."""
+        assert service.find_plugin_marketplace_dir("plugin1") == marketplace_dir
+        assert service.find_plugin_marketplace_dir("plugin2") is None
 
-    def test_plugin_name_validation_empty(self):
-        """Test that empty plugin name is rejected."""
-        with pytest.raises(ValueError, match="cannot be empty"):
-            PluginInfo(name="", description="Test")
+        marketplace_file.write_bytes(_MARKETPLACE_PLUGIN1_2)
 
-    def test_plugin_name_validation_too_long(self):
-        """Test that plugin name exceeding 256 characters is rejected."""
-        long_name = "a" * 257
-        with pytest.raises(ValueError, match="cannot exceed 256 characters"):
-            PluginInfo(name=long_name, description="Test")
+        assert service.find_plugin_marketplace_dir("plugin2") == marketplace_dir
+        assert service.find_plugin_in_marketplace("plugin2") == {
+            "name": "plugin2",
+            "source": "./p2",
+        }
 
-    def test_plugin_name_validation_invalid_chars(self):
-        """Test that plugin name with invalid characters is rejected."""
-        with pytest.raises(ValueError, match="alphanumeric"):
-            PluginInfo(name="test@plugin!", description="Test")
+    def test_element_content_reread_after_change(self, fresh_tree):
+        """Test that cached element content is refreshed when the file changes."""
+        skill_file = fresh_tree / _PLUGIN_SOURCE_DIR / "SKILL.md"
 
-    def test_plugin_name_validation_valid(self):
-        """Test that valid plugin names are accepted."""
-        # Should not raise
-        plugin = PluginInfo(name="test-plugin_123", description="Test")
-        assert plugin.name == "test-plugin_123"
+        service = PluginService(plugins_dir=fresh_tree)
+        element1 = service.load_plugin_element("test-plugin", "skills", "SKILL")
+        element2 = service.load_plugin_element("test-plugin", "skills", "SKILL")
+        assert element1.content == element2.content == "# Test Skill Content"
 
-    def test_element_type_validation_invalid(self):
-        """Test that invalid element type is rejected."""
-        from cc_plugin_mcp.models import PluginElement
+        # Replace the hard-linked file instead of rewriting the golden copy
+        replacement = skill_file.with_suffix(".tmp")
+        replacement.write_text("# Version 2 updated")
+        os.replace(replacement, skill_file)
+        element3 = service.load_plugin_element("test-plugin", "skills", "SKILL")
+        assert element3.content == "# Version 2 updated"
 
-        with pytest.raises(ValueError, match="Invalid element type"):
-            PluginElement(element_type="invalid_type", name="test")
+    def test_clear_cache_forces_reload(self, temp_plugin_dir, service):
+        """Test that clear_cache drops cached marketplace data and the index."""
+        _build_tree(temp_plugin_dir, {_MARKETPLACE_FILE: _MARKETPLACE_PLUGIN1})
 
-    def test_element_type_validation_valid(self):
-        """Test that valid element types are accepted."""
-        from cc_plugin_mcp.models import PluginElement
+        assert service.find_plugin_marketplace_dir("plugin1") is not None
 
-        # Should not raise for valid types
-        for element_type in ["skills", "agents", "commands"]:
-            element = PluginElement(element_type=element_type, name="test")
-            assert element.element_type == element_type
+        service.clear_cache()
 
-    def test_element_name_validation_empty(self):
-        """Test that empty element name is rejected."""
-        from cc_plugin_mcp.models import PluginElement
+        with patch(
+            "cc_plugin_mcp.services.plugin_service.orjson.loads",
+            wraps=orjson.loads,
+        ) as mock_loads:
+            assert service.find_plugin_marketplace_dir("plugin1") is not None
+            mock_loads.assert_called_once()
 
-        with pytest.raises(ValueError, match="cannot be empty"):
-            PluginElement(element_type="skills", name="")
+    def test_marketplace_reparsed_only_when_changed(self, temp_plugin_dir, service):
+        """Test that marketplace.json is re-parsed only after it changes."""
+        _build_tree(temp_plugin_dir, {_MARKETPLACE_FILE: _MARKETPLACE_PLUGIN1})
+        marketplace_file = temp_plugin_dir / _MARKETPLACE_FILE
 
-    def test_element_name_validation_too_long(self):
-        """Test that element name exceeding 256 characters is rejected."""
-        from cc_plugin_mcp.models import PluginElement
+        assert [p.name for p in service.get_plugin_list()] == ["plugin1"]
 
-        long_name = "a" * 257
-        with pytest.raises(ValueError, match="cannot exceed 256 characters"):
-            PluginElement(element_type="skills", name=long_name)
+        # Unchanged file is served from the cache without re-parsing
+        with patch(
+            "cc_plugin_mcp.services.plugin_service.orjson.loads"
+        ) as mock_load:
+            assert [p.name for p in service.get_plugin_list()] == ["plugin1"]
+            mock_load.assert_not_called()
+
+        # Modified file is picked up on the next call
+        marketplace_file.write_bytes(_MARKETPLACE_PLUGIN1_2)
+        assert [p.name for p in service.get_plugin_list()] == [
+            "plugin1",
+            "plugin2",
+        ]
+
+    def test_only_changed_marketplaces_loaded_in_pool(self, temp_plugin_dir, service):
+        """Test that unchanged marketplaces are not handed to the thread pool."""
+        files = {
+            f"marketplaces/marketplace{index}/.claude-plugin/marketplace.json": (
+                _MARKETPLACE_NAMED_TEMPLATE % f"plugin{index}".encode()
+            )
+            for index in range(3)
+        }
+        _build_tree(temp_plugin_dir, files)
+        service.get_plugin_list()
+
+        with patch(
+            "cc_plugin_mcp.services.plugin_service._MARKETPLACE_POOL"
+        ) as mock_pool:
+            mock_pool.map.side_effect = map
+            service.get_plugin_list()
+            mock_pool.map.assert_not_called()
+
+            changed = sorted(files)[1:]
+            for path in changed:
+                (temp_plugin_dir / path).write_bytes(
+                    _MARKETPLACE_NAMED_TEMPLATE % b"renamed-plugin"
+                )
+            service.get_plugin_list()
+
+        mock_pool.map.assert_called_once()
+        assert sorted(mock_pool.map.call_args.args[1]) == [
+            temp_plugin_dir / path for path in changed
+        ]
+
+
+class TestInputValidation:
+    """Tests for input validation."""
+
+    @pytest.mark.parametrize(
+        ("name", "match"),
+        [
+            ("", "cannot be empty"),
+            ("a" * 257, "cannot exceed 256 characters"),
+            ("test@plugin!", "alphanumeric"),
+        ],
+    )
+    def test_plugin_name_validation_invalid(self, name, match):
+        """Test that empty, too long and malformed plugin names are rejected."""
+        with pytest.raises(ValueError, match=match):
+            PluginInfo(name=name, description="Test")
+
+    def test_plugin_name_validation_valid(self):
+        """Test that valid plugin names are accepted."""
+        # Should not raise
+        plugin = PluginInfo(name="test-plugin_123", description="Test")
+        assert plugin.name == "test-plugin_123"
+
+    @pytest.mark.parametrize(
+        ("element_type", "name", "match"),
+        [
+            ("invalid_type", "test", "Invalid element type"),
+            ("skills", "", "cannot be empty"),
+            ("skills", "a" * 257, "cannot exceed 256 characters"),
+        ],
+    )
+    def test_element_validation_invalid(self, element_type, name, match):
+        """Test that invalid element types and names are rejected."""
+        with pytest.raises(ValueError, match=match):
+            PluginElement(element_type=element_type, name=name)
+
+    @pytest.mark.parametrize("element_type", ["skills", "agents", "commands"])
+    def test_element_type_validation_valid(self, element_type):
+        """Test that valid element types are accepted."""
+        # Should not raise
+        element = PluginElement(element_type=element_type, name="test")
+        assert element.element_type == element_type
 
 
 if __name__ == "__main__":